@@ -1,38 +1,95 @@
 from django.contrib import admin
-from .models import BlogPost, Category, WorkItem
+from django.contrib.admin.views.main import ChangeList
+from django.db.models.functions import Left
+from .models import BlogPost, Category, Contact, WorkItem
+from .paginators import EstimatedCountPaginator
 
 # Register your models here.
 
-class BlogPostAdmin(admin.ModelAdmin):
+PREVIEW_LENGTH = 80
+
+
+class PreviewChangeList(ChangeList):
+    """Defer the admin's ``preview_field`` and select only its first
+    PREVIEW_LENGTH characters. Change and delete views load the full row."""
+
+    def get_queryset(self, request, *args, **kwargs):
+        queryset = super().get_queryset(request, *args, **kwargs)
+        field = self.model_admin.preview_field
+        if field:
+            queryset = queryset.defer(field).annotate(preview=Left(field, PREVIEW_LENGTH))
+        return queryset
+
+
+class ScalableAdmin(admin.ModelAdmin):
+    """Changelist that stays fast on large tables.
+
+    Counts come from table statistics (see EstimatedCountPaginator), the
+    unfiltered total is not counted again, and the long text column named by
+    ``preview_field`` is shown as a preview (see PreviewChangeList).
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    preview_field = None
+
+    def get_changelist(self, request, **kwargs):
+        return PreviewChangeList
+
+    @admin.display(description='Preview')
+    def preview(self, obj):
+        return obj.preview
+
+
+class BlogPostAdmin(ScalableAdmin):
     list_display = (
         'title',        
-        'content',
+        'preview',
         'category',
         'image',
         'date_published',
         'image_url',
     )
+    list_select_related = ('category',)
+    search_fields = ('^title',)
+    preview_field = 'content'
 
-    ordering = ('category',)
+    ordering = ('-date_published',)
 
-class CategoryAdmin(admin.ModelAdmin):
+class CategoryAdmin(ScalableAdmin):
     list_display = (
         'friendly_name',
         'name',
     )
+    search_fields = ('^name',)
+
+    ordering = ('name',)
 
-class WorkItemAdmin(admin.ModelAdmin):
+class WorkItemAdmin(ScalableAdmin):
     list_display = (
         'title',
         'category',
         'image',
-        'description',
+        'preview',
         'link',
     )
+    search_fields = ('^title', '=category')
+    preview_field = 'description'
+
+    ordering = ('-id',)
+
+class ContactAdmin(ScalableAdmin):
+    list_display = (
+        'name',
+        'email',
+        'subject',
+        'preview',
+    )
+    search_fields = ('=email', '^name')
+    preview_field = 'message'
 
-    ordering = ('category',)
+    ordering = ('-id',)
 
 admin.site.register(BlogPost, BlogPostAdmin)
 admin.site.register(Category, CategoryAdmin)
 admin.site.register(WorkItem, WorkItemAdmin)
-# Register your models here.
+admin.site.register(Contact, ContactAdmin)
@@ -1,6 +1,9 @@
-from rest_framework import viewsets, generics
+from django.http import JsonResponse
+from rest_framework import status, viewsets, generics
+from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
+from .. import caching
 from ..models import BlogPost, WorkItem
 from ..models import Contact
 from ..serializers import BlogPostSerializer, BlogDetailSerializer ,WorkItemSerializer
@@ -18,6 +21,27 @@ class WorkItemViewSet(viewsets.ModelViewSet):
     queryset = WorkItem.objects.all().order_by('id')
     serializer_class = WorkItemSerializer
 
+@api_view(['POST'])
+def add_blog_post(request):
+        serializer =  BlogPostSerializer(data=request.data)
+        print(request.data)
+        if serializer.is_valid():
+            serializer.save()
+            return JsonResponse(serializer.data, status=status.HTTP_201_CREATED)
+        return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+ 
+@api_view(['GET'])
+def get_categories(request):
+    return JsonResponse(caching.categories(), safe=False)
+
+@api_view(['POST'])
+def create_work_item(request):
+        serializer = WorkItemSerializer(data=request.data)
+        if serializer.is_valid():
+            serializer.save()
+            return JsonResponse(serializer.data, status=status.HTTP_201_CREATED)
+        return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
 """ class WorkItemListCreate(generics.ListCreateAPIView):
     queryset = WorkItem.objects.all()
     serializer_class = WorkItemSerializer
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class HomeConfig(AppConfig):
     name = 'Home'
+
+    def ready(self):
+        from . import caching
+        caching.connect_signals()
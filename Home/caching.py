@@ -0,0 +1,105 @@
+"""Cached payloads for the category and list APIs.
+
+The payloads hold relative image URLs so one cached copy serves every
+host; the views make them absolute per request. Saving or deleting a
+model drops its key. That reaches every worker only with a shared cache
+backend (see ``CACHES`` in settings); ``LIST_CACHE_TIMEOUT`` bounds how
+stale a per-process cache can get.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+
+from .models import BlogPost, Category, WorkItem
+
+LIST_CACHE_TIMEOUT = getattr(settings, 'LIST_CACHE_TIMEOUT', 60)
+
+CATEGORIES_KEY = 'Home:categories'
+BLOG_POSTS_KEY = 'Home:blog_posts'
+WORK_ITEMS_KEY = 'Home:work_items'
+
+
+def _cached(key, build):
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, LIST_CACHE_TIMEOUT)
+    return data
+
+
+def _build_categories():
+    return list(Category.objects.values('id', 'name', 'friendly_name'))
+
+
+def _build_blog_posts():
+    posts = BlogPost.objects.select_related('category').order_by('-date_published')
+    return [
+        {
+            'id': post.id,
+            'title': post.title,
+            'content': post.content,
+            'date_published': post.date_published,
+            'image': post.image.url if post.image else None,
+            'category': {
+                'name': post.category.name,
+                'friendly_name': post.category.friendly_name,
+            } if post.category else None,
+        }
+        for post in posts
+    ]
+
+
+def _build_work_items():
+    return [
+        {
+            'id': item.id,
+            'title': item.title,
+            'category': item.category,
+            'description': item.description,
+            'image': item.image.url if item.image else None,
+            'link': item.link,
+        }
+        for item in WorkItem.objects.order_by('id')
+    ]
+
+
+def categories():
+    return _cached(CATEGORIES_KEY, _build_categories)
+
+
+def blog_posts():
+    return _cached(BLOG_POSTS_KEY, _build_blog_posts)
+
+
+def work_items():
+    return _cached(WORK_ITEMS_KEY, _build_work_items)
+
+
+def prime():
+    """Fill every list cache, e.g. in the gunicorn master before fork."""
+    for key, build in (
+        (CATEGORIES_KEY, _build_categories),
+        (BLOG_POSTS_KEY, _build_blog_posts),
+        (WORK_ITEMS_KEY, _build_work_items),
+    ):
+        cache.set(key, build(), LIST_CACHE_TIMEOUT)
+
+
+def _invalidate(*keys):
+    def receiver(sender, **kwargs):
+        cache.delete_many(keys)
+    return receiver
+
+
+# Blog posts embed their category's names, so a category change drops both.
+_RECEIVERS = {
+    Category: _invalidate(CATEGORIES_KEY, BLOG_POSTS_KEY),
+    BlogPost: _invalidate(BLOG_POSTS_KEY),
+    WorkItem: _invalidate(WORK_ITEMS_KEY),
+}
+
+
+def connect_signals():
+    for model, receiver in _RECEIVERS.items():
+        post_save.connect(receiver, sender=model, dispatch_uid=f'Home.caching.{model.__name__}.save')
+        post_delete.connect(receiver, sender=model, dispatch_uid=f'Home.caching.{model.__name__}.delete')
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from Home.warmup import warm_up
+
+
+class Command(BaseCommand):
+    help = 'Import the views, compile URL patterns and templates and prime the list caches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-caches', action='store_true',
+            help='Skip priming the category and list caches (no database access).')
+
+    def handle(self, *args, **options):
+        for step, seconds in warm_up(prime_caches=not options['no_caches']):
+            self.stdout.write(f'{step:<10} {seconds * 1000:8.1f} ms')
+        self.stdout.write(self.style.SUCCESS('Warm-up complete.'))
@@ -2,8 +2,8 @@ from django.db import models
 
 
 class Contact(models.Model):
-    name = models.CharField(max_length=250, null=False, blank=False)
-    email = models.EmailField(max_length=250, null=False, blank=False)
+    name = models.CharField(max_length=250, null=False, blank=False, db_index=True)
+    email = models.EmailField(max_length=250, null=False, blank=False, db_index=True)
     subject = models.CharField(max_length=250)
     message = models.TextField(null=False, blank=False, max_length=1024)
 
@@ -16,7 +16,7 @@ class Category(models.Model):
     class Meta:
         verbose_name_plural = 'Categories'
 
-    name = models.CharField(max_length=254)
+    name = models.CharField(max_length=254, db_index=True)
     friendly_name = models.CharField(max_length=254, null=True, blank=True)
 
     def __str__(self):
@@ -28,9 +28,9 @@ class Category(models.Model):
 
 class BlogPost(models.Model):
     category = models.ForeignKey('Category', null=True, blank=True, on_delete=models.SET_NULL)
-    title = models.CharField(max_length=20)
+    title = models.CharField(max_length=20, db_index=True)
     content = models.TextField(max_length=1024)
-    date_published = models.DateTimeField(auto_now_add=True)
+    date_published = models.DateTimeField(auto_now_add=True, db_index=True)
     image_url = models.URLField(max_length=1024, null=True, blank=True)
     image = models.ImageField(null=True, blank=True)
     link = models.URLField(max_length=1024, null=True, blank=True)
@@ -39,8 +39,8 @@ class BlogPost(models.Model):
         return self.title
 
 class WorkItem(models.Model):
-    title = models.CharField(max_length=20)
-    category = models.CharField(max_length=20, null=True, blank=True)
+    title = models.CharField(max_length=20, db_index=True)
+    category = models.CharField(max_length=20, null=True, blank=True, db_index=True)
     image = models.ImageField(upload_to='work_images/', blank=True, null=True)
     description = models.TextField(max_length=1024)
     link = models.URLField(max_length=1024, null=True, blank=True)
@@ -6,8 +6,47 @@ class CategorySerializer(serializers.ModelSerializer):
         model = Category
         fields = ['id', 'name', 'friendly_name']
 
-class BlogPostSerializer(serializers.ModelSerializer):
+class UploadedImageMixin:
+    """Attach a finished chunked upload, given by ``upload_id``, to ``image``."""
+    upload_target = None
+
+    def validate_upload_id(self, value):
+        from .uploads import UploadError, UploadSession
+
+        try:
+            session = UploadSession.load(value)
+        except UploadError as exc:
+            raise serializers.ValidationError(exc.detail)
+        if session.target != self.upload_target:
+            raise serializers.ValidationError('Upload was started for a different target.')
+        if not session.complete:
+            raise serializers.ValidationError('Upload is not complete.')
+        return session
+
+    def create(self, validated_data):
+        session = self._attach_upload(validated_data)
+        instance = super().create(validated_data)
+        if session is not None:
+            session.discard()
+        return instance
+
+    def update(self, instance, validated_data):
+        session = self._attach_upload(validated_data)
+        instance = super().update(instance, validated_data)
+        if session is not None:
+            session.discard()
+        return instance
+
+    def _attach_upload(self, validated_data):
+        session = validated_data.pop('upload_id', None)
+        if session is not None:
+            validated_data['image'] = session.store()
+        return session
+
+class BlogPostSerializer(UploadedImageMixin, serializers.ModelSerializer):
     category = serializers.PrimaryKeyRelatedField(queryset=Category.objects.all())
+    upload_id = serializers.UUIDField(write_only=True, required=False)
+    upload_target = 'blog_post'
     
     class Meta:
         model = BlogPost
@@ -20,26 +59,10 @@ class BlogDetailSerializer(serializers.ModelSerializer):
         model = BlogPost
         fields = ['id', 'title', 'content', 'date_published', 'image', 'category']
 
-class WorkItemSerializer(serializers.ModelSerializer):
-    
+class WorkItemSerializer(UploadedImageMixin, serializers.ModelSerializer):
+    upload_id = serializers.UUIDField(write_only=True, required=False)
+    upload_target = 'work_item'
+
     class Meta:
         model = WorkItem
-        fields = ['id', 'title', 'description', 'category', 'link', 'image']
-    
-    def create(self, validated_data):
-        image_file = validated_data.pop('image_file', None)
-        work_item = WorkItem.objects.create(**validated_data)
-        if image_file:
-            work_item.image = image_file
-            work_item.save()
-        return work_item
-
-    def update(self, instance, validated_data):
-        image_file = validated_data.pop('image_file', None)
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        if image_file:
-            instance.image = image_file
-        instance.save()
-        return instance
-    
\ No newline at end of file
+        fields = ['id', 'title', 'description', 'category', 'link', 'image', 'upload_id']
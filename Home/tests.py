@@ -1,3 +1,252 @@
-from django.test import TestCase
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from . import caching, uploads
+from .admin import PREVIEW_LENGTH
+from .models import Category, Contact, WorkItem
+from .paginators import EstimatedCountPaginator
+from .serializers import BlogPostSerializer, WorkItemSerializer
+from .uploads import UploadError, UploadSession, parse_content_range
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 40
+
+
+class UploadTestCase(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.addCleanup(shutil.rmtree, self.media_root)
+        patcher = mock.patch.object(uploads, 'TEMP_DIR', self.temp_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def start(self, target='work_item', size=len(PNG)):
+        response = self.client.post(
+            '/api/uploads/', json.dumps({'target': target, 'size': size}),
+            content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        return response.json()['upload_id']
+
+    def put(self, upload_id, data, start, total=len(PNG)):
+        return self.client.put(
+            f'/api/uploads/{upload_id}/', data, content_type='application/octet-stream',
+            headers={'Content-Range': f'bytes {start}-{start + len(data) - 1}/{total}'})
+
+    def upload(self, target='work_item', data=PNG):
+        upload_id = self.start(target, len(data))
+        self.assertTrue(self.put(upload_id, data, 0, len(data)).json()['complete'])
+        return upload_id
+
+
+class ParseContentRangeTests(TestCase):
+
+    def test_valid(self):
+        self.assertEqual(parse_content_range('bytes 0-9/20'), (0, 9, 20))
+
+    def test_missing_or_malformed(self):
+        for header in (None, '', 'bytes 0-9', 'items 0-9/20', 'bytes a-b/c'):
+            with self.assertRaises(UploadError):
+                parse_content_range(header)
+
+    def test_end_before_start(self):
+        with self.assertRaises(UploadError):
+            parse_content_range('bytes 9-0/20')
+
+
+class UploadEndpointTests(UploadTestCase):
+
+    def test_resume_from_reported_offset(self):
+        upload_id = self.start()
+        self.put(upload_id, PNG[:20], 0)
+        uploads._hashers.clear()  # as if the next chunk lands on another worker
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}/').json()['offset'], 20)
+        body = self.put(upload_id, PNG[20:], 20).json()
+        self.assertTrue(body['complete'])
+        self.assertEqual(body['sha256'], hashlib.sha256(PNG).hexdigest())
+
+    def test_wrong_offset_is_409(self):
+        upload_id = self.start()
+        self.put(upload_id, PNG[:20], 0)
+        response = self.put(upload_id, PNG[:20], 0)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}/').json()['offset'], 20)
+
+    def test_concurrent_chunk_is_409(self):
+        upload_id = self.start()
+        with open(UploadSession.load(upload_id).part_path, 'r+b') as part:
+            fcntl.flock(part, fcntl.LOCK_EX)
+            response = self.put(upload_id, PNG, 0)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}/').json()['offset'], 0)
+
+    def test_short_first_chunk_is_sniffed_later(self):
+        upload_id = self.start()
+        self.assertEqual(self.put(upload_id, PNG[:4], 0).status_code, 200)
+        self.assertTrue(self.put(upload_id, PNG[4:], 4).json()['complete'])
+
+    def test_rejects_non_image(self):
+        upload_id = self.start()
+        response = self.put(upload_id, b'GIF is not it'.ljust(len(PNG), b'\x00'), 0)
+        self.assertEqual(response.status_code, 415)
+
+    def test_size_limit(self):
+        response = self.client.post(
+            '/api/uploads/', json.dumps({'target': 'work_item', 'size': uploads.MAX_SIZE + 1}),
+            content_type='application/json')
+        self.assertEqual(response.status_code, 413)
+
+    def test_non_object_body_is_400(self):
+        for body in ('[1]', '"x"', 'not json'):
+            response = self.client.post('/api/uploads/', body, content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+
+    def test_finished_upload_stays_out_of_media(self):
+        self.upload()
+        self.assertEqual(os.listdir(self.media_root), [])
+
+    def test_unreadable_meta_is_unknown_upload(self):
+        upload_id = self.start()
+        with open(os.path.join(self.temp_dir, upload_id + '.json'), 'w') as meta:
+            meta.write('{"target": "wo')
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}/').status_code, 404)
+
+    def test_sweep_removes_expired_sessions(self):
+        upload_id = self.start()
+        session = UploadSession.load(upload_id)
+        uploads._hashers[upload_id] = (0, hashlib.sha256())
+        uploads.sweep_expired(now=time.time() + uploads.TTL + 1)
+        self.assertFalse(os.path.exists(session.part_path))
+        self.assertNotIn(upload_id, uploads._hashers)
+        with self.assertRaises(UploadError):
+            UploadSession.load(upload_id)
+
+
+class UploadAttachTests(UploadTestCase):
+
+    def test_work_item_attaches_upload(self):
+        upload_id = self.upload('work_item')
+        serializer = WorkItemSerializer(data={'title': 'w', 'description': 'd', 'upload_id': upload_id})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        item = serializer.save()
+        self.assertEqual(item.image.name, f'work_images/{hashlib.sha256(PNG).hexdigest()}.png')
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_identical_uploads_share_one_file(self):
+        for title in ('a', 'b'):
+            serializer = WorkItemSerializer(data={'title': title, 'description': 'd', 'upload_id': self.upload()})
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            serializer.save()
+        self.assertEqual(os.listdir(os.path.join(self.media_root, 'work_images')),
+                         [hashlib.sha256(PNG).hexdigest() + '.png'])
+
+    def test_blog_post_attaches_upload(self):
+        category = Category.objects.create(name='c')
+        upload_id = self.upload('blog_post')
+        serializer = BlogPostSerializer(data={
+            'title': 't', 'content': 'c', 'category': category.pk, 'upload_id': upload_id})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.save().image.name, f'{hashlib.sha256(PNG).hexdigest()}.png')
+
+    def test_target_mismatch_is_rejected(self):
+        upload_id = self.upload('blog_post')
+        serializer = WorkItemSerializer(data={'title': 'w', 'description': 'd', 'upload_id': upload_id})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('upload_id', serializer.errors)
+
+    def test_incomplete_upload_is_rejected(self):
+        upload_id = self.start()
+        self.put(upload_id, PNG[:20], 0)
+        serializer = WorkItemSerializer(data={'title': 'w', 'description': 'd', 'upload_id': upload_id})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('upload_id', serializer.errors)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CachingTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_save_invalidates_key(self):
+        caching.prime()
+        self.assertEqual(cache.get(caching.WORK_ITEMS_KEY), [])
+        WorkItem.objects.create(title='w', description='d')
+        self.assertIsNone(cache.get(caching.WORK_ITEMS_KEY))
+        self.assertEqual([item['title'] for item in caching.work_items()], ['w'])
+
+    def test_category_save_invalidates_blog_posts(self):
+        caching.prime()
+        Category.objects.create(name='c')
+        self.assertIsNone(cache.get(caching.CATEGORIES_KEY))
+        self.assertIsNone(cache.get(caching.BLOG_POSTS_KEY))
+
+
+class EstimatedCountPaginatorTests(TestCase):
+
+    def setUp(self):
+        Contact.objects.create(name='n', email='e@example.com', subject='s', message='m')
+
+    def mock_cursor(self, estimate):
+        cursor = mock.MagicMock()
+        cursor.__enter__.return_value.fetchone.return_value = (estimate,)
+        return mock.patch.object(connection, 'cursor', return_value=cursor)
+
+    def test_uses_estimate_above_threshold(self):
+        with mock.patch.object(connection, 'vendor', 'mysql'), self.mock_cursor(50000):
+            paginator = EstimatedCountPaginator(Contact.objects.order_by('-id'), 10)
+            self.assertEqual(paginator.count, 50000)
+
+    def test_filtered_queryset_counts_exactly(self):
+        with mock.patch.object(connection, 'vendor', 'mysql'):
+            paginator = EstimatedCountPaginator(Contact.objects.filter(name='n').order_by('-id'), 10)
+            self.assertEqual(paginator.count, 1)
+
+    def test_other_databases_count_exactly(self):
+        paginator = EstimatedCountPaginator(Contact.objects.order_by('-id'), 10)
+        with self.mock_cursor(50000) as cursor:
+            self.assertIsNone(paginator._estimated_count())
+        cursor.assert_not_called()
+        self.assertEqual(paginator.count, 1)
+
+
+class AdminChangeListTests(TestCase):
+
+    def setUp(self):
+        user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(user)
+        self.contact = Contact.objects.create(name='n', email='e@example.com', subject='s', message='m' * 300)
+
+    def test_changelist_shows_preview(self):
+        response = self.client.get('/TheACJBack/Home/contact/')
+        self.assertContains(response, 'm' * PREVIEW_LENGTH)
+        self.assertNotContains(response, 'm' * (PREVIEW_LENGTH + 1))
+
+    def test_change_view_loads_full_row_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(f'/TheACJBack/Home/contact/{self.contact.pk}/change/')
+        contact_queries = [q['sql'] for q in queries if 'FROM "Home_contact"' in q['sql']]
+        self.assertEqual(len(contact_queries), 1)
+        self.assertIn('"message"', contact_queries[0])
+
+    def test_category_changelist_counts_once(self):
+        Category.objects.create(name='c')
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/TheACJBack/Home/category/')
+        self.assertEqual(sum('COUNT(*)' in q['sql'] for q in queries), 1)
@@ -0,0 +1,285 @@
+"""Chunked, resumable image uploads for work items and blog posts.
+
+A client opens a session with the target model and the total size, then
+PUTs the file in pieces with a ``Content-Range`` header. Each piece is
+streamed to a temp file in ``CHUNK_SIZE`` reads, so no request holds more
+than one buffer in memory or a worker for the whole upload. A finished
+upload stays in the temp directory until a serializer attaches it; only
+then is it copied to media under its SHA-256, which means the same
+screenshot uploaded twice ends up as one file. Unattached uploads are
+swept with the rest of the temp files.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+import uuid
+
+from django.conf import settings
+from django.core.files import File
+
+from .models import BlogPost, WorkItem
+
+CHUNK_SIZE = getattr(settings, 'IMAGE_UPLOAD_CHUNK_SIZE', 64 * 1024)
+MAX_SIZE = getattr(settings, 'IMAGE_UPLOAD_MAX_SIZE', 10 * 1024 * 1024)
+TEMP_DIR = getattr(
+    settings, 'IMAGE_UPLOAD_TEMP_DIR',
+    os.path.join(tempfile.gettempdir(), 'theacj_uploads'))
+# Seconds an untouched session, finished or not, is kept before it is swept.
+TTL = getattr(settings, 'IMAGE_UPLOAD_TTL', 24 * 60 * 60)
+
+TARGETS = {
+    'work_item': WorkItem,
+    'blog_post': BlogPost,
+}
+
+# Magic bytes of the image types the site accepts, checked against the
+# first bytes of an upload before anything past them is written to disk.
+SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'GIF87a', '.gif'),
+    (b'GIF89a', '.gif'),
+)
+SNIFF_BYTES = 12
+
+CONTENT_RANGE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+# Running hashes of in-progress uploads, keyed by upload id. A resumed
+# upload that lands on another worker rebuilds its hash from the temp file.
+_hashers = {}
+
+
+class UploadError(Exception):
+    def __init__(self, detail, status=400):
+        super().__init__(detail)
+        self.detail = detail
+        self.status = status
+
+
+def sniff_extension(head):
+    for magic, extension in SIGNATURES:
+        if head.startswith(magic):
+            return extension
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return '.webp'
+    return None
+
+
+def sweep_expired(now=None):
+    """Remove temp files of sessions untouched for longer than ``TTL``."""
+    cutoff = (now or time.time()) - TTL
+    try:
+        entries = list(os.scandir(TEMP_DIR))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+    for upload_id in list(_hashers):
+        if not os.path.exists(UploadSession._path(upload_id, '.part')):
+            _hashers.pop(upload_id, None)
+
+
+def parse_content_range(header):
+    match = CONTENT_RANGE.match(header or '')
+    if not match:
+        raise UploadError('A "Content-Range: bytes start-end/total" header is required.')
+    start, end, total = (int(value) for value in match.groups())
+    if end < start:
+        raise UploadError('Invalid Content-Range.')
+    return start, end, total
+
+
+class UploadSession:
+
+    def __init__(self, upload_id, target, size, extension=None, sha256=None):
+        self.upload_id = upload_id
+        self.target = target
+        self.size = size
+        self.extension = extension
+        self.sha256 = sha256
+
+    @classmethod
+    def start(cls, target, size):
+        if target not in TARGETS:
+            raise UploadError(f'Unknown target "{target}".')
+        if not isinstance(size, int) or size <= 0:
+            raise UploadError('Size must be a positive number of bytes.')
+        if size > MAX_SIZE:
+            raise UploadError(f'Images are limited to {MAX_SIZE} bytes.', status=413)
+        os.makedirs(TEMP_DIR, exist_ok=True)
+        sweep_expired()
+        session = cls(str(uuid.uuid4()), target, size)
+        open(session.part_path, 'wb').close()
+        session.save_meta()
+        return session
+
+    @classmethod
+    def load(cls, upload_id):
+        try:
+            upload_id = str(uuid.UUID(str(upload_id)))
+        except ValueError:
+            raise UploadError('Unknown upload.', status=404)
+        try:
+            with open(cls._path(upload_id, '.json')) as meta:
+                return cls(upload_id, **json.load(meta))
+        except (FileNotFoundError, ValueError, TypeError):
+            raise UploadError('Unknown upload.', status=404)
+
+    @staticmethod
+    def _path(upload_id, suffix):
+        return os.path.join(TEMP_DIR, upload_id + suffix)
+
+    @property
+    def part_path(self):
+        return self._path(self.upload_id, '.part')
+
+    @property
+    def done_path(self):
+        return self._path(self.upload_id, '.done')
+
+    @property
+    def complete(self):
+        return self.sha256 is not None
+
+    @property
+    def offset(self):
+        if self.complete:
+            return self.size
+        try:
+            return os.path.getsize(self.part_path)
+        except FileNotFoundError:
+            return 0
+
+    @property
+    def field(self):
+        return TARGETS[self.target]._meta.get_field('image')
+
+    def save_meta(self):
+        # Write then rename, so a concurrent load() never sees half a file.
+        with tempfile.NamedTemporaryFile('w', dir=TEMP_DIR, suffix='.tmp', delete=False) as meta:
+            json.dump({
+                'target': self.target,
+                'size': self.size,
+                'extension': self.extension,
+                'sha256': self.sha256,
+            }, meta)
+        os.replace(meta.name, self._path(self.upload_id, '.json'))
+
+    def as_dict(self):
+        return {
+            'upload_id': self.upload_id,
+            'target': self.target,
+            'size': self.size,
+            'offset': self.offset,
+            'complete': self.complete,
+            'sha256': self.sha256,
+            'chunk_size': CHUNK_SIZE,
+        }
+
+    def write(self, stream, start, end, total):
+        """Write bytes ``start``..``end`` read from ``stream``.
+
+        Whatever arrives before the client drops is kept, so the client can
+        ask for the offset and carry on from there. The part file is locked
+        while a chunk is written; a retry racing the original gets a 409.
+        """
+        if self.complete:
+            raise UploadError('Upload is already complete.', status=409)
+        if total != self.size or end >= self.size:
+            raise UploadError(f'Content-Range does not match the declared size of {self.size} bytes.')
+        try:
+            part = open(self.part_path, 'r+b')
+        except FileNotFoundError:
+            raise UploadError('Upload is already complete.', status=409)
+        with part:
+            try:
+                fcntl.flock(part, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                raise UploadError('Another chunk of this upload is being written.', status=409)
+            stat = os.fstat(part.fileno())
+            if stat.st_nlink == 0:
+                # Finalized and removed while we were opening it.
+                raise UploadError('Upload is already complete.', status=409)
+            offset = stat.st_size
+            if offset == self.size:
+                raise UploadError('Upload is already complete.', status=409)
+            if offset > self.size:
+                raise UploadError('Upload is corrupt; start a new one.', status=409)
+            if start != offset:
+                raise UploadError(f'Expected a chunk starting at byte {offset}.', status=409)
+
+            part.seek(offset)
+            remaining = end - start + 1
+            hasher = self._hasher(offset)
+            while remaining:
+                try:
+                    piece = stream.read(min(CHUNK_SIZE, remaining))
+                except OSError:
+                    break
+                if not piece:
+                    break
+                if self.extension is None:
+                    self._sniff(part, offset, piece)
+                part.write(piece)
+                hasher.update(piece)
+                remaining -= len(piece)
+                offset += len(piece)
+            part.flush()
+            _hashers[self.upload_id] = (offset, hasher)
+
+            if offset == self.size:
+                self._finalize(hasher)
+
+    def _sniff(self, part, offset, piece):
+        """Check the type once the first ``SNIFF_BYTES`` are available."""
+        needed = min(SNIFF_BYTES, self.size)
+        head = os.pread(part.fileno(), offset, 0) + piece
+        if len(head) < needed:
+            return
+        self.extension = sniff_extension(head[:needed])
+        if self.extension is None:
+            raise UploadError('Only PNG, JPEG, GIF and WebP images are accepted.', status=415)
+        self.save_meta()
+
+    def _hasher(self, offset):
+        cached = _hashers.get(self.upload_id)
+        if cached and cached[0] == offset:
+            return cached[1]
+        hasher = hashlib.sha256()
+        with open(self.part_path, 'rb') as part:
+            for piece in iter(lambda: part.read(CHUNK_SIZE), b''):
+                hasher.update(piece)
+        return hasher
+
+    def store(self):
+        """Copy the finished upload to media unless an identical file is
+        already there, and return its storage name."""
+        field = self.field
+        name = field.generate_filename(None, self.sha256 + self.extension)
+        if not field.storage.exists(name):
+            with open(self.done_path, 'rb') as done:
+                name = field.storage.save(name, File(done, name=name))
+        return name
+
+    def discard(self):
+        """Drop the session's temp files once the image is attached."""
+        _hashers.pop(self.upload_id, None)
+        for suffix in ('.part', '.done', '.json'):
+            try:
+                os.remove(self._path(self.upload_id, suffix))
+            except FileNotFoundError:
+                pass
+
+    def _finalize(self, hasher):
+        _hashers.pop(self.upload_id, None)
+        os.replace(self.part_path, self.done_path)
+        self.sha256 = hasher.hexdigest()
+        self.save_meta()
@@ -1,26 +1,25 @@
-from django.conf import settings
-from django.shortcuts import render, redirect,  get_object_or_404
-from django.core.mail import send_mail
-from django.contrib import messages
 import csv
+import json
+from django.shortcuts import render, redirect
+from django.contrib import messages
 from django.http import HttpResponse, JsonResponse
-from django.core.serializers import serialize
-from .forms import ContactForm, BlogPostForm
-from .models import BlogPost, Contact, WorkItem, Category    # Import your BlogPost model
-from django.views.decorators.csrf import ensure_csrf_cookie,csrf_exempt
+from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_http_methods
-from django.http import JsonResponse
-from rest_framework import status
-from rest_framework.decorators import api_view
-from rest_framework.response import Response
-from .serializers import WorkItemSerializer, BlogPostSerializer, CategorySerializer
-from rest_framework.parsers import JSONParser, MultiPartParser
+from . import caching
+from .models import BlogPost
+
+# The DRF views live in Home/api/views.py, so importing this module does
+# not load DRF. Forms and the upload helpers are imported inside the views
+# that use them; `manage.py warmup` and the gunicorn preload hook import
+# them ahead of the first request.
 
 @ensure_csrf_cookie
 def csrf_token_view(request):
     return JsonResponse({'detail': 'CSRF cookie set'})
 
 def index(request):
+    from .forms import ContactForm
+
     # Retrieve recent blog posts from the database
     recent_posts = BlogPost.objects.order_by('-date_published')[:3]
     
@@ -59,6 +58,8 @@ def success(request):
     return HttpResponse('Success!')
 
 def add_blog_post(request):
+    from .forms import BlogPostForm
+
     if request.method == 'POST':
         form = BlogPostForm(request.POST, request.FILES)  # Include request.FILES
         if form.is_valid():
@@ -73,59 +74,46 @@ def add_blog_post(request):
     
 @require_http_methods(["GET"])  
 def blog_posts_api(request):
-    posts = BlogPost.objects.all().order_by('-date_published')
     data = [
-        {
-            'id': post.id,
-            'title': post.title,
-            'content': post.content,
-            'date_published': post.date_published,
-            'image': request.build_absolute_uri(post.image.url) if post.image else None,
-            'category': {
-                'name': post.category.name,
-                'friendly_name': post.category.friendly_name,
-            } if post.category else None,
-            }
-            for post in posts
-        ]
+        dict(post, image=request.build_absolute_uri(post['image']) if post['image'] else None)
+        for post in caching.blog_posts()
+    ]
     return JsonResponse(data, safe=False)
 
-@api_view(['POST'])
-def add_blog_post(request):
-        serializer =  BlogPostSerializer(data=request.data)
-        print(request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return JsonResponse(serializer.data, status=status.HTTP_201_CREATED)
-        return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
- 
-@api_view(['GET'])
-def get_categories(request):
-    categories = Category.objects.all()
-    serializer = CategorySerializer(categories, many=True)
-    return JsonResponse(serializer.data, safe=False)
-
 @require_http_methods(["GET"])  # Only allow GET and POST requests
 def work_items_api(request):
-        posts = WorkItem.objects.all().order_by('id')
-        data = []
-        for post in posts:
-            data.append({
-                'id': post.id,
-                'title': post.title,
-                'category': post.category,
-                'description': post.description,
-                'image': request.build_absolute_uri(post.image.url) if post.image else None,
-                'link': post.link
-            })
+        data = [
+            dict(item, image=request.build_absolute_uri(item['image']) if item['image'] else None)
+            for item in caching.work_items()
+        ]
         return JsonResponse(data, safe=False)
 
-@api_view(['POST'])
-def create_work_item(request):
-        serializer = WorkItemSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return JsonResponse(serializer.data, status=status.HTTP_201_CREATED)
-        return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
- 
- 
\ No newline at end of file
+
+@require_http_methods(["POST"])
+def start_image_upload(request):
+    from .uploads import UploadError, UploadSession
+
+    try:
+        payload = json.loads(request.body or b'{}')
+        if not isinstance(payload, dict):
+            raise ValueError
+        session = UploadSession.start(payload.get('target'), payload.get('size'))
+    except ValueError:
+        return JsonResponse({'detail': 'Expected a JSON body with "target" and "size".'}, status=400)
+    except UploadError as exc:
+        return JsonResponse({'detail': exc.detail}, status=exc.status)
+    return JsonResponse(session.as_dict(), status=201)
+
+@require_http_methods(["GET", "PUT"])
+def image_upload_chunk(request, upload_id):
+    from .uploads import UploadError, UploadSession, parse_content_range
+
+    # Read the raw request stream ourselves so no parser buffers the chunk.
+    try:
+        session = UploadSession.load(upload_id)
+        if request.method == 'PUT':
+            start, end, total = parse_content_range(request.headers.get('Content-Range'))
+            session.write(request, start, end, total)
+    except UploadError as exc:
+        return JsonResponse({'detail': exc.detail}, status=exc.status)
+    return JsonResponse(session.as_dict())
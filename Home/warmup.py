@@ -0,0 +1,78 @@
+"""Pay the per-process startup costs before the first request does.
+
+Run from ``manage.py warmup`` or the gunicorn ``when_ready`` hook in
+``gunicorn.conf.py``; with ``preload_app`` the workers forked afterwards
+inherit the imported modules, compiled URL patterns and loaded templates.
+The list caches are primed in the shared ``CACHES`` backend, so the
+management command fills them for running workers too.
+"""
+import importlib
+import time
+
+from django.db import connections
+from django.template.loader import get_template
+from django.urls import get_resolver
+
+from . import caching
+
+# Modules the views import lazily.
+MODULES = (
+    'Home.views',
+    'Home.api.views',
+    'Home.forms',
+    'Home.serializers',
+    'Home.uploads',
+)
+
+TEMPLATES = (
+    'Home/index.html',
+)
+
+
+def import_modules():
+    for name in MODULES:
+        importlib.import_module(name)
+
+
+def _compile_patterns(resolver):
+    for pattern in resolver.url_patterns:
+        # Route regexes are compiled on first access.
+        pattern.pattern.regex
+        if hasattr(pattern, 'url_patterns'):
+            _compile_patterns(pattern)
+
+
+def compile_urls():
+    resolver = get_resolver()
+    _compile_patterns(resolver)
+    resolver.reverse_dict
+    resolver.namespace_dict
+
+
+def load_templates():
+    for name in TEMPLATES:
+        get_template(name)
+
+
+STEPS = (
+    ('imports', import_modules),
+    ('urls', compile_urls),
+    ('templates', load_templates),
+    ('caches', caching.prime),
+)
+
+
+def warm_up(prime_caches=True):
+    """Run each warm-up step and return ``(step, seconds)`` pairs."""
+    timings = []
+    try:
+        for name, step in STEPS:
+            if name == 'caches' and not prime_caches:
+                continue
+            started = time.perf_counter()
+            step()
+            timings.append((name, time.perf_counter() - started))
+    finally:
+        # A connection opened here must not be shared by forked workers.
+        connections.close_all()
+    return timings
@@ -1,5 +1,6 @@
 """This is the settings file for my portfolio project"""
 import os
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -132,6 +133,23 @@ USE_TZ = True
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Chunked image uploads (Home/uploads.py)
+IMAGE_UPLOAD_CHUNK_SIZE = 64 * 1024
+IMAGE_UPLOAD_MAX_SIZE = 10 * 1024 * 1024
+IMAGE_UPLOAD_TTL = 24 * 60 * 60
+
+# A file cache is shared by every gunicorn worker on the host, so a save in
+# one worker invalidates the list payloads for all of them (Home/caching.py)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(tempfile.gettempdir(), 'theacj_cache'),
+    }
+}
+
+# Seconds the category and list API payloads stay cached (Home/caching.py)
+LIST_CACHE_TIMEOUT = 60
+
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'frontend/dist')]
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
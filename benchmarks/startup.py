@@ -0,0 +1,73 @@
+"""Startup-time benchmark: first requests on a cold vs a warmed process.
+
+Each run is a fresh interpreter against an in-memory SQLite database and
+cache, so nothing is shared between runs.
+
+    python benchmarks/startup.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import json
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+URLS = ('/', '/api/categories/', '/api/blog-posts/', '/api/works/')
+
+CHILD = '''
+import json, os, sys, time
+started = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'TheACJ.settings')
+from django.conf import settings
+settings.DATABASES['default'] = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}
+settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+import django
+django.setup()
+from django.core.management import call_command
+call_command('migrate', run_syncdb=True, verbosity=0, skip_checks=True)
+result = {'setup': time.perf_counter() - started}
+if sys.argv[1] == 'warm':
+    from Home.warmup import warm_up
+    started = time.perf_counter()
+    warm_up()
+    result['warm_up'] = time.perf_counter() - started
+from django.test import Client
+client = Client()
+for url in %r:
+    started = time.perf_counter()
+    client.get(url)
+    result[url] = time.perf_counter() - started
+print(json.dumps(result))
+''' % (URLS,)
+
+
+def run(mode):
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD, mode],
+        cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    results = {mode: [run(mode) for _ in range(args.runs)] for mode in ('cold', 'warm')}
+    print(f'median of {args.runs} runs, milliseconds')
+    print(f'{"":<20}{"cold":>10}{"warm":>10}')
+    for key in ('setup', 'warm_up') + URLS:
+        row = []
+        for mode in ('cold', 'warm'):
+            values = [result[key] for result in results[mode] if key in result]
+            row.append(f'{statistics.median(values) * 1000:10.1f}' if values else f'{"-":>10}')
+        print(f'{key:<20}' + ''.join(row))
+    first = {mode: statistics.median(sum(result[url] for url in URLS) for result in results[mode])
+             for mode in results}
+    print(f'{"first requests":<20}{first["cold"] * 1000:10.1f}{first["warm"] * 1000:10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+"""Gunicorn settings: load and warm the app in the master before forking.
+
+    gunicorn -c gunicorn.conf.py
+"""
+wsgi_app = 'TheACJ.wsgi:application'
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the preloaded app is imported and before the
+    # first worker is forked, so every worker starts warm.
+    from Home.warmup import warm_up
+
+    try:
+        timings = warm_up()
+    except Exception:
+        server.log.exception('Warm-up failed; workers will start cold.')
+        return
+    server.log.info('Warm-up done: %s', ', '.join(
+        f'{step} {seconds * 1000:.1f} ms' for step, seconds in timings))